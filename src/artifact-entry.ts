@@ -0,0 +1,15 @@
+// ARTIFACT ENTRY HELPERS
+// Small pieces of artifact parsing kept out of index.ts so they can be tested
+
+// Collect a zip entry's raw chunks and decode them once when the entry ends.
+// Decoding chunk by chunk would mangle a multi-byte UTF-8 character that
+// happens to straddle two chunks.
+export function readEntryText(entry: NodeJS.EventEmitter, onText: (text: string) => void): void {
+  const chunks: Buffer[] = [];
+  entry.on('data', (chunk: Buffer) => {
+    chunks.push(chunk);
+  });
+  entry.on('end', () => {
+    onText(Buffer.concat(chunks).toString('utf8'));
+  });
+}
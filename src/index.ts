@@ -3,6 +3,7 @@ import { createNodeMiddleware, createProbot, Probot } from 'probot';
 import { Readable } from 'stream';
 import * as unzipper from 'unzipper';
 import { addEvaluationToApp } from './simple-evaluation';
+import { readEntryText } from './artifact-entry';
 
 // Helper function as specified in requirements
 function errMsg(e: unknown): string {
@@ -315,11 +316,7 @@ async function extractEvaluationFromRun(context: any, runId: number): Promise<{
         .pipe(unzipper.Parse())
         .on('entry', (entry: any) => {
           if (entry.path.endsWith('.json') || entry.path === 'results.json') {
-            let content = '';
-            entry.on('data', (chunk: Buffer) => {
-              content += chunk.toString();
-            });
-            entry.on('end', () => {
+            readEntryText(entry, (content) => {
               try {
                 const data = JSON.parse(content);
                 if (data.metrics?.win_rate !== undefined && data.threshold !== undefined) {
@@ -17,10 +17,11 @@ export class GitHubIPWhitelist {
   private allowedIPs: Set<string> = new Set();
   private lastUpdate: Date = new Date(0);
   private updateInterval = 3600000; // 1 hour
+  private requestTimeout = 5000; // 5 seconds, the fetch runs on the webhook request path
   
   async updateWhitelist(): Promise<void> {
     try {
-      const response = await axios.get('https://api.github.com/meta');
+      const response = await axios.get('https://api.github.com/meta', { timeout: this.requestTimeout });
       const { hooks, web, api, git, packages, pages, actions } = response.data;
       
       // Combine all GitHub IP ranges
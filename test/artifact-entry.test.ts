@@ -0,0 +1,28 @@
+/**
+ * Artifact entry decoding tests
+ */
+
+import { EventEmitter } from 'events';
+import { readEntryText } from '../src/artifact-entry';
+
+describe('readEntryText', () => {
+  test('should decode a multi-byte character split across chunks', () => {
+    const json = JSON.stringify({ metrics: { win_rate: 0.8 }, threshold: 0.7, note: 'café ✓' });
+    const bytes = Buffer.from(json, 'utf8');
+    // Split inside the 3-byte encoding of '✓'
+    const split = bytes.indexOf(Buffer.from('✓', 'utf8')) + 1;
+
+    const entry = new EventEmitter();
+    const onText = jest.fn();
+    readEntryText(entry, onText);
+
+    entry.emit('data', bytes.subarray(0, split));
+    entry.emit('data', bytes.subarray(split));
+    expect(onText).not.toHaveBeenCalled();
+
+    entry.emit('end');
+    expect(onText).toHaveBeenCalledTimes(1);
+    expect(onText).toHaveBeenCalledWith(json);
+    expect(JSON.parse(onText.mock.calls[0][0] as string).note).toBe('café ✓');
+  });
+});
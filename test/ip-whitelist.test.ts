@@ -0,0 +1,48 @@
+/**
+ * GitHub IP whitelist refresh tests
+ */
+
+import axios from 'axios';
+import { GitHubIPWhitelist } from '../src/security/advanced-2025';
+
+jest.mock('axios', () => ({
+  __esModule: true,
+  default: { get: jest.fn() }
+}));
+
+const mockedGet = axios.get as jest.Mock;
+
+describe('GitHubIPWhitelist', () => {
+  afterEach(() => {
+    jest.useRealTimers();
+    mockedGet.mockReset();
+  });
+
+  test('should give up on a stalled meta request and keep the existing allowlist', async () => {
+    const whitelist = new GitHubIPWhitelist();
+
+    mockedGet.mockResolvedValueOnce({ data: { hooks: ['192.30.252.0/22'] } });
+    await whitelist.updateWhitelist();
+    expect(await whitelist.isAllowed('192.30.252.1')).toBe(true);
+
+    // Simulate a connection that never answers: only axios' timeout ends it
+    jest.useFakeTimers();
+    mockedGet.mockImplementationOnce((_url: string, config: { timeout: number }) =>
+      new Promise((_resolve, reject) => {
+        setTimeout(() => reject(new Error(`timeout of ${config.timeout}ms exceeded`)), config.timeout);
+      })
+    );
+
+    const update = whitelist.updateWhitelist();
+    expect(mockedGet).toHaveBeenLastCalledWith('https://api.github.com/meta', { timeout: 5000 });
+
+    jest.advanceTimersByTime(5000);
+    await update;
+
+    expect(console.error).toHaveBeenCalledWith(
+      'Failed to update GitHub IP whitelist:',
+      expect.objectContaining({ message: 'timeout of 5000ms exceeded' })
+    );
+    expect(await whitelist.isAllowed('192.30.252.1')).toBe(true);
+  });
+});